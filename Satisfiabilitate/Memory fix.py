@@ -1,6 +1,5 @@
 import random
 import time
-from itertools import combinations
 import sys
 import psutil
 import os
@@ -9,6 +8,11 @@ import csv
 import tracemalloc  # Modul pentru măsurarea detaliată a memoriei
 import random
 
+from cdcl import cdcl_with_timeout
+from clause_store import ClauseStore, as_clause_list
+from resolution_engine import clashing_pairs
+from trail import davis_putnam_iterative
+
 # --- SAT Solvers ---
 
 def resolve(clause1, clause2):
@@ -35,10 +39,9 @@ def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000):
         if len(new_clauses) > max_clauses:
             print(f"Rezoluție: Prea multe clauze ({len(new_clauses)}) la iterația {iteration}. Oprirea rezoluției.")
             return None
-        new_pairs = list(combinations(new_clauses, 2))
         generated = set()
-        for clause1, clause2 in new_pairs:
-            resolvent = resolve(list(clause1), list(clause2))
+        for clause1, clause2 in clashing_pairs(new_clauses):
+            resolvent = resolve(clause1, clause2)
             if resolvent is not None:
                 if not resolvent:  # Clauza vidă: nesatisfiabil
                     return False
@@ -49,53 +52,19 @@ def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000):
     return None
 
 def davis_putnam(clauses):
-    while clauses:
-        # Dacă există o clauză vidă, formula este nesatisfiabilă.
-        if any(c == [] for c in clauses):
-            return False
-
-        # Construim mulțimea tuturor literalelor din formulă.
-        literals = {l for clause in clauses for l in clause}
-        # Dacă nu mai sunt litere, formula este satisfiabilă.
-        if not literals:
-            return True
-        
-        # Eliminare de literale pure.
-        pure_literal_found = False
-        for l in literals:
-            if -l not in literals:
-                clauses = [c for c in clauses if l not in c]
-                pure_literal_found = True
-                break
-        if pure_literal_found:
-            if not clauses:
-                return True
-            continue  # Reîncepem ciclul cu clauzele actualizate
-
-        # Propagare de clauze unitare.
-        unit_clauses = [c[0] for c in clauses if len(c) == 1]
-        if unit_clauses:
-            for u in unit_clauses:
-                clauses = [list(filter(lambda x: x != -u, c)) for c in clauses if u not in c]
-            if not clauses:
-                return True
-            continue  # Reîncepem ciclul
-
-        # Înainte de branching, verificăm dacă mai sunt litere.
-        if not literals:
-            return True
-        
-        # Alegem o variabilă pentru branching.
-        var = abs(next(iter(literals)))
-        left = davis_putnam([[v for v in c if v != -var] for c in clauses if var not in c])
-        right = davis_putnam([[v for v in c if v != var] for c in clauses if -var not in c])
-        return left or right
-
-    return False
+    """
+    Căutare Davis-Putnam pe un index literal -> clauze.
+    Numărul de apariții pozitive și negative ale fiecărui literal se actualizează
+    incremental, astfel încât toate literalele pure sunt eliminate într-o singură
+    trecere, iar propagarea unitară atinge doar clauzele literalului atribuit.
+    Returnează True dacă formula este satisfiabilă, False altfel.
+    """
+    return davis_putnam_iterative(clauses)
 
 def dpll(clauses, assignment={}, deadline=None):
     if deadline is not None and time.time() > deadline:
         raise TimeoutError("Timpul alocat DPLL a expirat")
+    clauses = as_clause_list(clauses)
     if not clauses:  # Toate clauzele sunt satisfăcute.
         return True, assignment
     if [] in clauses:  # S-a găsit o clauză vidă.
@@ -105,11 +74,11 @@ def dpll(clauses, assignment={}, deadline=None):
     if not literals:
         return True, assignment
     
-    # Eliminare de literale pure.
-    for l in literals:
-        if -l not in literals:
-            new_clauses = [c for c in clauses if l not in c]
-            return dpll(new_clauses, {**assignment, l: True}, deadline=deadline)
+    # Eliminare de literale pure: toate literalele pure sunt eliminate într-o singură trecere.
+    pure = {l for l in literals if -l not in literals}
+    if pure:
+        new_clauses = [c for c in clauses if pure.isdisjoint(c)]
+        return dpll(new_clauses, {**assignment, **dict.fromkeys(pure, True)}, deadline=deadline)
 
     # Propagare de unitate.
     unit_clauses = [c[0] for c in clauses if len(c) == 1]
@@ -145,12 +114,13 @@ def generate_random_clause(num_literals):
     clause = [lit if random.choice([True, False]) else -lit for lit in clause]
     return clause
 
-def generate_random_formula(num_clauses, num_literals, unsat_injection_probability=0.3):
+def generate_random_formula(num_clauses, num_literals, unsat_injection_probability=0.3, store=None):
     """
     Generează o formulă CNF ca listă de clauze.
     Opțional, forțează nesatisfiabilitatea prin adăugarea unor clauze unitare contradictorii.
+    Dacă se dă un ClauseStore în 'store', clauzele se adaugă în el și se returnează store-ul.
     """
-    formula = []
+    formula = [] if store is None else store
     for _ in range(num_clauses):
         clause = generate_random_clause(num_literals)
         formula.append(clause)
@@ -162,13 +132,14 @@ def generate_random_formula(num_clauses, num_literals, unsat_injection_probabili
 
 # --- Funcții pentru citirea formulărilor din fișier ---
 
-def read_formula_from_file(filename):
+def read_formula_from_file(filename, store=None):
     """
     Citește o formulă dintr-un fișier. Se așteaptă ca fiecare linie să conțină o clauză,
     literalile fiind separate prin spațiu, iar clauza terminându-se cu 0.
-    Returnează formula ca listă de clauze (lista de liste de int).
+    Returnează formula ca listă de clauze (lista de liste de int), sau store-ul dat
+    (un ClauseStore) în care au fost adăugate clauzele.
     """
-    formula = []
+    formula = [] if store is None else store
     with open(filename, 'r') as f:
         for line in f:
             line = line.strip()
@@ -181,21 +152,22 @@ def read_formula_from_file(filename):
             formula.append(clause)
     return formula
 
-def read_formulas_from_file(filename):
+def read_formulas_from_file(filename, compact=False):
     """
     Citește mai multe formule dintr-un fișier.
     Se presupune că o formulă este separată de alta printr-o linie goală.
-    Returnează o listă de formule.
+    Returnează o listă de formule; cu compact=True fiecare formulă este un ClauseStore.
     """
+    new_formula = ClauseStore if compact else list
     formulas = []
     with open(filename, 'r') as f:
-        current_formula = []
+        current_formula = new_formula()
         for line in f:
             line = line.strip()
             if not line:
                 if current_formula:
                     formulas.append(current_formula)
-                    current_formula = []
+                    current_formula = new_formula()
                 continue
             parts = line.split()
             clause = [int(x) for x in parts]
@@ -209,7 +181,7 @@ def read_formulas_from_file(filename):
 # --- Funcție de comparare a solutoarelor SAT ---
 def solve_sat_with_all_methods(formula):
     """
-    Rulează toate cele trei algoritme (Rezoluție, Davis-Putnam și DPLL) pe formulă.
+    Rulează toți cei patru algoritmi (Rezoluție, Davis-Putnam, DPLL și CDCL) pe formulă.
     Returnează un dicționar cu (rezultat, timp de execuție, memorie consumată în MB, CPU consumat în secunde,
     memorie detaliată (peak, măsurată cu tracemalloc, în MB)) pentru fiecare algoritm.
     """
@@ -270,6 +242,24 @@ def solve_sat_with_all_methods(formula):
     tracemalloc.stop()
     results["DPLL"] = (result_dpll, elapsed_dpll, mem_dpll, cpu_dpll, detailed_mem_dpll)
 
+    # CDCL
+    gc.collect()
+    tracemalloc.start()
+    start_mem = process.memory_info().rss
+    start_cpu = process.cpu_times()
+    start_time = time.time()
+    result_cdcl, _ = cdcl_with_timeout(formula, timeout=5)
+    gc.collect()
+    elapsed_cdcl = time.time() - start_time
+    end_mem = process.memory_info().rss
+    end_cpu = process.cpu_times()
+    mem_cdcl = (end_mem - start_mem) / (1024 * 1024)
+    cpu_cdcl = ((end_cpu.user - start_cpu.user) + (end_cpu.system - start_cpu.system))
+    current_d, peak_d = tracemalloc.get_traced_memory()
+    detailed_mem_cdcl = peak_d / (1024 * 1024)
+    tracemalloc.stop()
+    results["CDCL"] = (result_cdcl, elapsed_cdcl, mem_cdcl, cpu_cdcl, detailed_mem_cdcl)
+
     return results
 
 # --- Salvarea rezultatelor în fișier CSV ---
@@ -304,11 +294,11 @@ def main():
     if len(sys.argv) > 1:
         input_file = sys.argv[1]
         try:
-            formulas = read_formulas_from_file(input_file)
+            formulas = read_formulas_from_file(input_file, compact=True)
             print(f"S-au încărcat {len(formulas)} formulă(e) din fișierul {input_file}.")
         except Exception as e:
             try:
-                formula = read_formula_from_file(input_file)
+                formula = read_formula_from_file(input_file, store=ClauseStore())
                 formulas.append(formula)
                 print(f"S-a încărcat o singură formulă din fișierul {input_file}.")
             except Exception as ex:
@@ -319,7 +309,7 @@ def main():
         num_clauses = 500    # Numărul de clauze per formulă.
         num_literals = 300    # Variabilele vor fi în intervalul [1, num_literals].
         unsat_prob = 0.3     # Probabilitatea de injectare a clauzelor contradictorii.
-        formulas = [generate_random_formula(num_clauses, num_literals, unsat_prob)
+        formulas = [generate_random_formula(num_clauses, num_literals, unsat_prob, store=ClauseStore())
                     for _ in range(num_formulas)]
     save_results_to_file("sat_results_comparison.csv", formulas)
 
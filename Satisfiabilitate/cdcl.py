@@ -0,0 +1,257 @@
+import heapq
+import time
+
+from watched import WatchedPropagator
+
+# --- Conflict-Driven Clause Learning ---
+
+def luby(x):
+    """Returns the x-th element (0-based) of the Luby restart sequence 1, 1, 2, 1, 1, 2, 4, ..."""
+    size, seq = 1, 0
+    while size < x + 1:
+        seq += 1
+        size = 2 * size + 1
+    while size - 1 != x:
+        size = (size - 1) >> 1
+        seq -= 1
+        x = x % size
+    return 1 << seq
+
+
+class CDCLSolver(WatchedPropagator):
+    """
+    Conflict-driven clause-learning solver on top of the watched-literal engine.
+    Conflicts are analysed to the first unique implication point (1-UIP), the
+    learned clause is minimized and the search backjumps non-chronologically
+    to the second-highest level in it. Learned clauses are scored by their LBD
+    (number of distinct decision levels) and the worst half is periodically
+    deleted. Branching uses VSIDS activities with phase saving and Luby restarts.
+    """
+
+    def __init__(self, clauses, restart_base=100, reduce_base=2000, reduce_inc=300,
+                 var_decay=0.95):
+        super().__init__(clauses)
+        self.num_original = len(self.clauses)
+        self.lbd = {}           # learned clause index -> LBD
+        self.activity = {v: 0.0 for v in self.variables}
+        self.var_inc = 1.0
+        self.var_decay = var_decay
+        self.phase = {}
+        self.heap = [(0.0, v) for v in sorted(self.variables)]
+        self.restart_base = restart_base
+        self.reduce_base = reduce_base
+        self.reduce_inc = reduce_inc
+        self.conflicts = 0
+        self.decisions = 0
+        self.learned_total = 0
+        self.deleted_total = 0
+
+    # --- Branching heuristic ---
+
+    def bump(self, var):
+        act = self.activity[var] + self.var_inc
+        self.activity[var] = act
+        if act > 1e100:
+            for v in self.activity:
+                self.activity[v] *= 1e-100
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in self.activity if self.value(v) is None]
+            heapq.heapify(self.heap)
+        elif self.value(var) is None:
+            heapq.heappush(self.heap, (-act, var))
+
+    def pick_branch_literal(self):
+        """Returns the unassigned variable with the highest activity (with its saved phase), or None."""
+        heap = self.heap
+        while heap:
+            neg_act, var = heapq.heappop(heap)
+            if self.value(var) is None and -neg_act == self.activity[var]:
+                return var if self.phase.get(var, False) else -var
+        return None
+
+    def backtrack(self, level):
+        if len(self.trail_lim) <= level:
+            return
+        for lit in self.trail[self.trail_lim[level]:]:
+            var = abs(lit)
+            self.phase[var] = lit > 0
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        super().backtrack(level)
+
+    # --- Conflict analysis ---
+
+    def analyze(self, confl):
+        """
+        Derives the 1-UIP clause for the conflicting clause.
+        Returns (learned clause with the asserting literal first, backjump level, LBD).
+        """
+        current = len(self.trail_lim)
+        seen = set()
+        learnt = [None]
+        counter = 0
+        p = None
+        idx = len(self.trail) - 1
+        while True:
+            clause = self.clauses[confl]
+            for q in (clause if p is None else clause[1:]):
+                var = abs(q)
+                if var not in seen and self.level[var] > 0:
+                    seen.add(var)
+                    self.bump(var)
+                    if self.level[var] == current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while abs(self.trail[idx]) not in seen:
+                idx -= 1
+            p = self.trail[idx]
+            idx -= 1
+            counter -= 1
+            if counter == 0:
+                break
+            confl = self.reason[abs(p)]
+        learnt[0] = -p
+        self.var_inc /= self.var_decay
+
+        # Recursive minimization: drop literals implied by the rest of the clause.
+        marked = {abs(l) for l in learnt}
+        learnt = [learnt[0]] + [q for q in learnt[1:]
+                                if self.reason[abs(q)] is None or not self.redundant(q, marked)]
+
+        if len(learnt) == 1:
+            return learnt, 0, 1
+        best = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        lbd = len({self.level[abs(l)] for l in learnt})
+        return learnt, self.level[abs(learnt[1])], lbd
+
+    def redundant(self, lit, marked):
+        """
+        Checks whether lit is implied by the marked literals through reason clauses.
+        Variables proven redundant along the way stay marked.
+        """
+        stack = [lit]
+        added = []
+        while stack:
+            reason = self.clauses[self.reason[abs(stack.pop())]]
+            for q in reason[1:]:
+                var = abs(q)
+                if var in marked or self.level[var] == 0:
+                    continue
+                if self.reason[var] is None:
+                    for v in added:
+                        marked.discard(v)
+                    return False
+                marked.add(var)
+                added.append(var)
+                stack.append(q)
+        return True
+
+    # --- Learned clause database ---
+
+    def reduce_db(self):
+        """
+        Deletes the half of the learned clauses with the highest LBD.
+        Glue clauses (LBD <= 2) and clauses that are currently a reason are kept.
+        """
+        locked = {self.reason[abs(l)] for l in self.trail}
+        learned = sorted(self.lbd, key=lambda ci: (self.lbd[ci], len(self.clauses[ci])))
+        half = len(learned) // 2
+        remove = {ci for ci in learned[half:] if self.lbd[ci] > 2 and ci not in locked}
+        if not remove:
+            return
+
+        remap = {}
+        clauses = []
+        for ci, clause in enumerate(self.clauses):
+            if ci not in remove:
+                remap[ci] = len(clauses)
+                clauses.append(clause)
+        self.clauses = clauses
+        self.lbd = {remap[ci]: lbd for ci, lbd in self.lbd.items() if ci not in remove}
+        for var, reason in self.reason.items():
+            if reason is not None:
+                self.reason[var] = remap.get(reason)
+        # Positions 0 and 1 still hold valid watches, so the lists can be rebuilt from them.
+        self.watches = {}
+        for ci, clause in enumerate(clauses):
+            self.watches.setdefault(clause[0], []).append(ci)
+            self.watches.setdefault(clause[1], []).append(ci)
+        self.deleted_total += len(remove)
+
+    # --- Search ---
+
+    def solve(self, deadline=None):
+        """
+        Runs the CDCL search.
+        Returns True (SAT, model in self.model()) or False (UNSAT).
+        Raises TimeoutError when the deadline (timestamp) is passed.
+        """
+        if self.empty_clause or not self.assign_units():
+            return False
+        restarts = 0
+        restart_limit = self.restart_base * luby(0)
+        conflicts_since_restart = 0
+        reductions = 0
+        next_reduce = self.reduce_base
+
+        while True:
+            confl = self.propagate()
+            if confl is not None:
+                self.conflicts += 1
+                conflicts_since_restart += 1
+                if not self.trail_lim:
+                    return False
+                learnt, back_level, lbd = self.analyze(confl)
+                self.backtrack(back_level)
+                if len(learnt) == 1:
+                    self.assign(learnt[0])
+                else:
+                    ci = self.attach(learnt)
+                    self.lbd[ci] = lbd
+                    self.assign(learnt[0], ci)
+                self.learned_total += 1
+                if self.conflicts >= next_reduce:
+                    self.reduce_db()
+                    reductions += 1
+                    next_reduce = self.conflicts + self.reduce_base + self.reduce_inc * reductions
+                continue
+
+            if deadline is not None and time.time() > deadline:
+                raise TimeoutError("CDCL timeout reached")
+            if conflicts_since_restart >= restart_limit:
+                restarts += 1
+                restart_limit = self.restart_base * luby(restarts)
+                conflicts_since_restart = 0
+                self.backtrack(0)
+                continue
+
+            lit = self.pick_branch_literal()
+            if lit is None:
+                return True
+            self.decisions += 1
+            self.decide(lit)
+
+
+def cdcl(clauses, assignment={}, deadline=None):
+    """
+    Solves the formula with conflict-driven clause learning.
+    Returns (True, assignment) with assignment as {variable: bool}, or (False, {}).
+    Raises TimeoutError when the deadline (timestamp) is passed.
+    """
+    solver = CDCLSolver(clauses)
+    if solver.solve(deadline=deadline):
+        return True, {**assignment, **solver.model()}
+    return False, {}
+
+
+def cdcl_with_timeout(clauses, assignment={}, timeout=5):
+    """
+    Wrapper for CDCL that uses a timeout.
+    If the search does not complete within 'timeout' seconds, returns (None, {}).
+    """
+    deadline = time.time() + timeout
+    try:
+        return cdcl(clauses, assignment, deadline=deadline)
+    except TimeoutError:
+        return None, {}
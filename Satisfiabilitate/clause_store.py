@@ -0,0 +1,94 @@
+from array import array
+
+# --- Compact Clause Storage ---
+
+class ClauseStore:
+    """
+    Array-backed CNF formula.
+    All literals live in one contiguous array('i') (4 bytes per literal) and
+    offsets[i]:offsets[i + 1] delimits clause i, instead of one Python list
+    object per clause and one int object per literal.
+
+    Indexing and iteration return zero-copy memoryview slices that support
+    len(), indexing, iteration and the 'in' operator like a clause list.
+    Views keep the buffer exported: release them before appending new clauses,
+    otherwise the array cannot be resized and BufferError is raised.
+    """
+
+    def __init__(self, clauses=()):
+        self.literals = array('i')
+        self.offsets = array('q', [0])
+        for clause in clauses:
+            self.append(clause)
+
+    @classmethod
+    def from_clauses(cls, clauses):
+        """Returns clauses unchanged if it already is a ClauseStore, otherwise packs it."""
+        if isinstance(clauses, cls):
+            return clauses
+        return cls(clauses)
+
+    def append(self, clause):
+        self.literals.extend(clause)
+        self.offsets.append(len(self.literals))
+
+    def extend(self, clauses):
+        for clause in clauses:
+            self.append(clause)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("clause index out of range")
+        return memoryview(self.literals)[self.offsets[index]:self.offsets[index + 1]]
+
+    def __iter__(self):
+        view = memoryview(self.literals)
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield view[offsets[i]:offsets[i + 1]]
+
+    def clause(self, index):
+        """Returns clause 'index' as a list of ints."""
+        return self.literals[self.offsets[index]:self.offsets[index + 1]].tolist()
+
+    def to_list(self):
+        """Converts the store back to the list-of-lists formula format."""
+        literals = self.literals
+        offsets = self.offsets
+        return [literals[offsets[i]:offsets[i + 1]].tolist() for i in range(len(offsets) - 1)]
+
+    def num_literals(self):
+        """Total number of literal occurrences."""
+        return len(self.literals)
+
+    def variables(self):
+        return {abs(l) for l in self.literals}
+
+    def nbytes(self):
+        """Size of the literal and offset buffers in bytes."""
+        return (len(self.literals) * self.literals.itemsize
+                + len(self.offsets) * self.offsets.itemsize)
+
+    def __eq__(self, other):
+        if isinstance(other, ClauseStore):
+            return self.literals == other.literals and self.offsets == other.offsets
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        # Same text as the list format, so the existing file writers stay unchanged.
+        return repr(self.to_list())
+
+
+def as_clause_list(clauses):
+    """Returns the list-of-lists form of a formula given either as a list or as a ClauseStore."""
+    if isinstance(clauses, ClauseStore):
+        return clauses.to_list()
+    return clauses
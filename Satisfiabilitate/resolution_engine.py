@@ -0,0 +1,50 @@
+# --- Resolution Helpers ---
+
+def clashing_pairs(clauses):
+    """
+    Yields every unordered pair (clause1, clause2) of clauses that share a
+    complementary literal, each pair exactly once.
+    Clauses are indexed by literal, so pairs that cannot resolve are never
+    looked at, and pairs are streamed instead of materialized: memory stays
+    proportional to the number of literal occurrences, not to the pair count.
+    """
+    clauses = list(clauses)
+    occurs = {}
+    for i, clause in enumerate(clauses):
+        for l in clause:
+            occurs.setdefault(l, []).append(i)
+    for i, clause1 in enumerate(clauses):
+        partners = set()    # Clauses already paired with clause1 (it may clash on several literals).
+        for l in clause1:
+            for j in occurs.get(-l, ()):
+                if j > i and j not in partners:
+                    partners.add(j)
+                    yield clause1, clauses[j]
+
+
+def index_clauses(clauses, occurs=None):
+    """Adds clauses to a literal -> list of clauses index and returns the index."""
+    if occurs is None:
+        occurs = {}
+    for clause in clauses:
+        for l in clause:
+            occurs.setdefault(l, []).append(clause)
+    return occurs
+
+
+def delta_pairs(delta, occurs):
+    """
+    Semi-naive pairing: yields every pair that has at least one clause from
+    'delta' (the clauses added in the previous round) and clashes on some
+    literal. 'occurs' must index the full clause set, delta included.
+    Pairs of two old clauses were resolved in an earlier round and are skipped;
+    pairs inside delta are yielded once.
+    """
+    for clause1 in delta:
+        partners = set()
+        for l in clause1:
+            for clause2 in occurs.get(-l, ()):
+                if clause2 in partners or (clause2 in delta and not clause1 < clause2):
+                    continue
+                partners.add(clause2)
+                yield clause1, clause2
@@ -1,6 +1,11 @@
 import random
 import time
-from itertools import combinations
+
+from cdcl import cdcl, cdcl_with_timeout
+from clause_store import ClauseStore, as_clause_list
+from resolution_engine import clashing_pairs, delta_pairs, index_clauses
+from trail import davis_putnam_iterative, dpll_iterative, dpll_iterative_with_timeout
+from watched import dpll_watched, dpll_watched_with_timeout
 
 # --- SAT Solvers ---
 
@@ -13,15 +18,24 @@ def resolve(clause1, clause2):
             return list(new_clause)
     return None
 
-def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000):
+def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000, semi_naive=False, stats=None):
     """
     Performs resolution with limits on iterations and overall clause count.
+    With semi_naive=True, each round only resolves the clauses derived in the
+    previous round against the full set, since all older pairs were already
+    resolved; a round then costs about as much as its new clauses, so
+    max_iterations can be raised a lot at the same cost.
+    If a dict is passed as 'stats', stats["delta_sizes"] receives the number of
+    new clauses derived in each round.
     Returns:
       - False if an empty clause is derived (unsat),
       - True if resolution completes with no new clauses (suggesting SAT),
       - None if it hits an iteration or clause count limit.
     """
     new_clauses = set(map(tuple, clauses))
+    delta = new_clauses
+    occurs = index_clauses(new_clauses) if semi_naive else None
+    delta_sizes = [] if stats is None else stats.setdefault("delta_sizes", [])
     iteration = 0
     while iteration < max_iterations:
         iteration += 1
@@ -31,40 +45,37 @@ def resolution_algorithm(clauses, max_iterations=3, max_clauses=5000):
             print(f"Resolution: Too many clauses ({len(new_clauses)}) at iteration {iteration}. Aborting resolution.")
             return None
 
-        new_pairs = list(combinations(new_clauses, 2))
+        if semi_naive:
+            pairs = delta_pairs(delta, occurs)
+        else:
+            pairs = clashing_pairs(new_clauses)
         generated = set()
-        for clause1, clause2 in new_pairs:
-            resolvent = resolve(list(clause1), list(clause2))
+        for clause1, clause2 in pairs:
+            resolvent = resolve(clause1, clause2)
             if resolvent is not None:
                 if not resolvent:  # Empty clause found: unsat
                     return False
                 generated.add(tuple(sorted(resolvent)))
+        delta = generated.difference(new_clauses)
+        delta_sizes.append(len(delta))
         # If no new resolvents were generated, return SAT.
-        if not generated.difference(new_clauses):
+        if not delta:
             return True
-        new_clauses |= generated
+        new_clauses |= delta
+        if semi_naive:
+            index_clauses(delta, occurs)
     # If we reach here, the limit was reached.
     return None
 
 def davis_putnam(clauses):
-    while clauses:
-        literals = {l for clause in clauses for l in clause}
-        # Pure literal elimination.
-        for l in literals:
-            if -l not in literals:
-                clauses = [c for c in clauses if l not in c]
-                break
-        if not clauses:
-            return True
-        # Unit clause propagation.
-        unit_clauses = [c[0] for c in clauses if len(c) == 1]
-        for u in unit_clauses:
-            clauses = [list(filter(lambda x: x != -u, c)) for c in clauses if u not in c]
-        else:
-            var = abs(next(iter(literals)))
-            return davis_putnam([[v for v in c if v != -var] for c in clauses if var not in c]) or \
-                   davis_putnam([[v for v in c if v != var] for c in clauses if -var not in c])
-    return False
+    """
+    Davis-Putnam search on a literal -> clause occurrence index.
+    Positive and negative literal counts are updated incrementally, so all pure
+    literals are eliminated in one pass and unit propagation only touches the
+    clauses of the assigned literal; branching is done without recursion.
+    Returns True if the formula is satisfiable, False otherwise.
+    """
+    return davis_putnam_iterative(clauses)
 
 def dpll(clauses, assignment={}, deadline=None):
     """
@@ -73,6 +84,7 @@ def dpll(clauses, assignment={}, deadline=None):
     """
     if deadline is not None and time.time() > deadline:
         raise TimeoutError("DPLL timeout reached")
+    clauses = as_clause_list(clauses)
         
     if not clauses:  # All clauses satisfied.
         return True, assignment
@@ -80,11 +92,11 @@ def dpll(clauses, assignment={}, deadline=None):
         return False, {}
     
     literals = {l for clause in clauses for l in clause}
-    # Pure literal elimination.
-    for l in literals:
-        if -l not in literals:
-            new_clauses = [c for c in clauses if l not in c]
-            return dpll(new_clauses, {**assignment, l: True}, deadline=deadline)
+    # Pure literal elimination: every pure literal is removed in the same pass.
+    pure = {l for l in literals if -l not in literals}
+    if pure:
+        new_clauses = [c for c in clauses if pure.isdisjoint(c)]
+        return dpll(new_clauses, {**assignment, **dict.fromkeys(pure, True)}, deadline=deadline)
 
     # Unit propagation.
     unit_clauses = [c[0] for c in clauses if len(c) == 1]
@@ -113,6 +125,16 @@ def dpll_with_timeout(clauses, assignment={}, timeout=5):
     except TimeoutError:
         return None, {}
 
+# Search back-ends that solve_sat can fall back to after resolution.
+# Each entry maps a mode name to (label, solver); solvers share the
+# dpll_with_timeout signature and return (result, assignment).
+DPLL_MODES = {
+    "dpll": ("DPLL", dpll_with_timeout),
+    "watched": ("DPLL (watched)", dpll_watched_with_timeout),
+    "iterative": ("DPLL (iterative)", dpll_iterative_with_timeout),
+    "cdcl": ("CDCL", cdcl_with_timeout),
+}
+
 # --- Random Formula Generator ---
 
 def generate_random_clause(num_literals):
@@ -141,19 +163,26 @@ def solve_sat_with_all_methods(formula):
     result_dpll, _ = dpll_with_timeout(formula, timeout=5)
     elapsed_dpll = time.time() - start_time
 
+    # Conflict-driven clause learning
+    start_time = time.time()
+    result_cdcl, _ = cdcl_with_timeout(formula, timeout=5)
+    elapsed_cdcl = time.time() - start_time
+
     return {
         "Resolution": (result_res, elapsed_res),
         "Davis-Putnam": (result_dp, elapsed_dp),
-        "DPLL": (result_dpll, elapsed_dpll)
+        "DPLL": (result_dpll, elapsed_dpll),
+        "CDCL": (result_cdcl, elapsed_cdcl)
     }
 
 
-def generate_random_formula(num_clauses, num_literals, unsat_injection_probability=0.3):
+def generate_random_formula(num_clauses, num_literals, unsat_injection_probability=0.3, store=None):
     """
     Generates a CNF formula as a list of clauses.
     With a given probability, forces unsatisfiability by adding a pair of contradictory unit clauses.
+    If a ClauseStore is passed as 'store', the clauses are appended to it and the store is returned.
     """
-    formula = []
+    formula = [] if store is None else store
     for _ in range(num_clauses):
         clause = generate_random_clause(num_literals)
         formula.append(clause)
@@ -165,10 +194,11 @@ def generate_random_formula(num_clauses, num_literals, unsat_injection_probabili
 
 # --- SAT Solver Selector and File Output ---
 
-def solve_sat(formula):
+def solve_sat(formula, mode="dpll"):
     """
     Tries to solve the given formula with Resolution first.
-    If resolution reaches its limits, it falls back to DPLL (with a timeout).
+    If resolution reaches its limits, it falls back to the search back-end
+    selected by 'mode' (a key of DPLL_MODES), run with a timeout.
     Returns a tuple:
        (algorithm_used, result (True for SAT, False for UNSAT, or "TIMEOUT"), runtime)
     """
@@ -179,12 +209,13 @@ def solve_sat(formula):
     if result_res is not None:
         return ("Resolution", result_res, elapsed_res)
     else:
+        label, solver = DPLL_MODES[mode]
         start_time = time.time()
-        result_dpll, _ = dpll_with_timeout(formula, timeout=5)
+        result_dpll, _ = solver(formula, timeout=5)
         elapsed_dpll = time.time() - start_time
         if result_dpll is None:
-            return ("DPLL", "TIMEOUT", elapsed_dpll)
-        return ("DPLL", result_dpll, elapsed_dpll)
+            return (label, "TIMEOUT", elapsed_dpll)
+        return (label, result_dpll, elapsed_dpll)
 
 def save_results_to_file(filename, formulas):
     with open(filename, 'w') as f:
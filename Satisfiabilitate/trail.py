@@ -0,0 +1,232 @@
+import time
+
+# --- Trail-Based Clause Store ---
+
+class TrailFormula:
+    """
+    Single mutable clause store for non-recursive DPLL.
+    Clauses are never copied: each clause keeps a count of its true and of its
+    unassigned literals, and an occurrence list maps every literal to the
+    clauses containing it. Assigning a literal updates only the clauses in the
+    occurrence lists of the literal and its negation; every assignment is
+    recorded on a trail and undone in reverse order on backtrack.
+
+    Memory is O(L + V) for a formula with L literal occurrences over V
+    variables (clauses, occurrence lists and counters are stored once, the
+    trail and decision-level markers hold at most V entries), independent of
+    the search depth.
+
+    lit_count[l] is the number of not-yet-satisfied clauses containing l. It is
+    updated only when a clause switches between satisfied and unsatisfied, and
+    whenever a count drops to zero the opposite literal is queued as a pure
+    literal candidate, so pure literals never require a rescan of the formula.
+    """
+
+    def __init__(self, clauses):
+        self.clauses = []
+        self.occurs = {}        # literal -> list of clause indices containing it.
+        self.empty_clause = False
+        for clause in clauses:
+            lits = list(dict.fromkeys(clause))
+            if any(-l in lits for l in lits):
+                continue        # Tautologies are always satisfied.
+            if not lits:
+                self.empty_clause = True
+            ci = len(self.clauses)
+            self.clauses.append(lits)
+            for l in lits:
+                self.occurs.setdefault(l, []).append(ci)
+        self.true_count = [0] * len(self.clauses)
+        self.free_count = [len(c) for c in self.clauses]
+        self.unsatisfied = len(self.clauses)   # Clauses with no true literal.
+        self.conflicts = 0                     # Clauses with every literal false.
+        self.value = {}         # variable -> bool
+        self.trail = []
+        self.trail_lim = []
+        self.pending = [ci for ci, c in enumerate(self.clauses) if len(c) == 1]
+        self.lit_count = {l: len(cis) for l, cis in self.occurs.items()}
+        self.pure_candidates = [l for l in self.occurs if -l not in self.occurs]
+
+    def literal_value(self, lit):
+        val = self.value.get(abs(lit))
+        if val is None:
+            return None
+        return val if lit > 0 else not val
+
+    def assign(self, lit):
+        """Makes lit true and updates the counters of the clauses it touches."""
+        self.value[abs(lit)] = lit > 0
+        self.trail.append(lit)
+        true_count = self.true_count
+        free_count = self.free_count
+        for ci in self.occurs.get(lit, ()):
+            true_count[ci] += 1
+            free_count[ci] -= 1
+            if true_count[ci] == 1:
+                self.unsatisfied -= 1
+                self._clause_satisfied(ci)
+        for ci in self.occurs.get(-lit, ()):
+            free_count[ci] -= 1
+            if true_count[ci] == 0:
+                if free_count[ci] == 0:
+                    self.conflicts += 1
+                elif free_count[ci] == 1:
+                    self.pending.append(ci)
+
+    def unassign(self, lit):
+        del self.value[abs(lit)]
+        true_count = self.true_count
+        free_count = self.free_count
+        for ci in self.occurs.get(lit, ()):
+            true_count[ci] -= 1
+            free_count[ci] += 1
+            if true_count[ci] == 0:
+                self.unsatisfied += 1
+                for l in self.clauses[ci]:
+                    self.lit_count[l] += 1
+        for ci in self.occurs.get(-lit, ()):
+            if true_count[ci] == 0 and free_count[ci] == 0:
+                self.conflicts -= 1
+            free_count[ci] += 1
+
+    def _clause_satisfied(self, ci):
+        lit_count = self.lit_count
+        for l in self.clauses[ci]:
+            lit_count[l] -= 1
+            if not lit_count[l] and lit_count.get(-l):
+                self.pure_candidates.append(-l)
+
+    def eliminate_pure(self):
+        """
+        Assigns every pure literal (one whose negation occurs in no unsatisfied
+        clause) in a single pass over the queued candidates. Literals that turn
+        pure because of these assignments are queued and handled in the same pass.
+        Returns the number of literals assigned.
+        """
+        assigned = 0
+        candidates = self.pure_candidates
+        lit_count = self.lit_count
+        while candidates:
+            l = candidates.pop()
+            if abs(l) not in self.value and lit_count[l] and not lit_count.get(-l):
+                self.assign(l)
+                assigned += 1
+        return assigned
+
+    def propagate(self):
+        """
+        Assigns the remaining literal of every unit clause until fixpoint.
+        Returns False if some clause has all its literals false.
+        """
+        pending = self.pending
+        while pending and not self.conflicts:
+            ci = pending.pop()
+            if self.true_count[ci] or self.free_count[ci] != 1:
+                continue
+            for l in self.clauses[ci]:
+                if abs(l) not in self.value:
+                    self.assign(l)
+                    break
+        pending.clear()
+        return not self.conflicts
+
+    def decide(self, lit):
+        """Opens a new decision level and assigns lit on it."""
+        self.trail_lim.append(len(self.trail))
+        self.assign(lit)
+
+    def backtrack(self, level):
+        """Undoes every assignment made above the given decision level."""
+        stop = self.trail_lim[level]
+        for lit in reversed(self.trail[stop:]):
+            self.unassign(lit)
+        del self.trail[stop:]
+        del self.trail_lim[level:]
+        self.pending.clear()
+        self.pure_candidates.clear()
+
+    def model(self):
+        """Returns the current assignment as {variable: bool}."""
+        return dict(self.value)
+
+
+def simplify(formula, pure_literals):
+    """Runs unit propagation and, optionally, pure literal elimination to a fixpoint."""
+    while formula.propagate():
+        if not (pure_literals and formula.eliminate_pure()):
+            return True
+    return False
+
+
+def trail_search(formula, deadline=None, pure_literals=True):
+    """
+    Iterative DPLL search over a TrailFormula: unit propagation and pure literal
+    elimination, then branching on the most frequent unassigned variable (true
+    first), with chronological backtracking. Stops as soon as every clause is
+    satisfied.
+    Returns True (model left on the formula) or False.
+    Raises TimeoutError when the deadline (timestamp) is passed.
+    """
+    if formula.empty_clause or not simplify(formula, pure_literals):
+        return False
+    order = sorted(formula.occurs, key=lambda l: -len(formula.occurs[l]))
+    order = list(dict.fromkeys(abs(l) for l in order))
+    flipped = []    # For every decision level: was its decision already flipped?
+
+    while True:
+        if deadline is not None and time.time() > deadline:
+            raise TimeoutError("DPLL timeout reached")
+        if not formula.unsatisfied:
+            return True
+
+        var = next(v for v in order if v not in formula.value)
+        formula.decide(var)
+        flipped.append(False)
+        while not simplify(formula, pure_literals):
+            while flipped and flipped[-1]:
+                flipped.pop()
+            if not flipped:
+                return False
+            level = len(flipped) - 1
+            lit = formula.trail[formula.trail_lim[level]]
+            formula.backtrack(level)
+            flipped.pop()
+            formula.decide(-lit)
+            flipped.append(True)
+
+
+def dpll_iterative(clauses, assignment={}, deadline=None):
+    """
+    Non-recursive drop-in alternative to dpll().
+    Works on one TrailFormula with an explicit trail and decision-level markers,
+    so memory stays O(formula size + variables) at any search depth and deep
+    formulas cannot hit the recursion limit.
+    Returns (True, assignment) with assignment as {variable: bool}, or (False, {}).
+    Raises TimeoutError when the deadline (timestamp) is passed.
+    """
+    formula = TrailFormula(clauses)
+    if trail_search(formula, deadline=deadline):
+        return True, {**assignment, **formula.model()}
+    return False, {}
+
+
+def dpll_iterative_with_timeout(clauses, assignment={}, timeout=5):
+    """
+    Wrapper for dpll_iterative that uses a timeout.
+    If the search does not complete within 'timeout' seconds, returns (None, {}).
+    """
+    deadline = time.time() + timeout
+    try:
+        return dpll_iterative(clauses, assignment, deadline=deadline)
+    except TimeoutError:
+        return None, {}
+
+
+def davis_putnam_iterative(clauses):
+    """
+    Non-recursive Davis-Putnam search on the occurrence index: all pure literals
+    are eliminated per pass from the incremental counts, units are propagated
+    and the remaining formula is branched on without copying it.
+    Returns True if the formula is satisfiable, False otherwise.
+    """
+    return trail_search(TrailFormula(clauses))
@@ -0,0 +1,212 @@
+import time
+
+# --- Two-Watched-Literal Propagation ---
+
+class WatchedPropagator:
+    """
+    Unit propagation engine that keeps two watched literals per clause.
+    Assigning a literal only visits the clauses watching its negation, so a
+    propagation costs time proportional to the clauses it can actually affect
+    instead of the whole formula.
+
+    The assignment lives on a trail; trail_lim holds the trail length at the
+    start of every decision level so backtracking is a simple truncation.
+    """
+
+    def __init__(self, clauses):
+        self.clauses = []       # Clause literals; positions 0 and 1 are watched.
+        self.watches = {}       # literal -> list of clause indices watching it.
+        self.units = []         # Literals of the unit clauses in the input.
+        self.empty_clause = False
+        self.lit_value = {}     # literal -> True/False for assigned variables.
+        self.level = {}         # variable -> decision level of its assignment.
+        self.reason = {}        # variable -> clause index that forced it (None for decisions).
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+        self.variables = set()
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def add_clause(self, clause):
+        """
+        Adds an input clause. Duplicate literals are dropped and tautologies ignored.
+        Returns the clause index, or None if the clause was not stored as a watched clause.
+        """
+        lits = list(dict.fromkeys(clause))
+        self.variables.update(abs(l) for l in lits)
+        if any(-l in lits for l in lits):
+            return None
+        if not lits:
+            self.empty_clause = True
+            return None
+        if len(lits) == 1:
+            self.units.append(lits[0])
+            return None
+        return self.attach(lits)
+
+    def attach(self, lits):
+        """Stores a clause of at least two literals and watches its first two."""
+        index = len(self.clauses)
+        self.clauses.append(lits)
+        self.watches.setdefault(lits[0], []).append(index)
+        self.watches.setdefault(lits[1], []).append(index)
+        return index
+
+    def value(self, lit):
+        """Returns True/False for an assigned literal, None if it is unassigned."""
+        return self.lit_value.get(lit)
+
+    def decision_level(self):
+        return len(self.trail_lim)
+
+    def assign(self, lit, reason=None):
+        var = abs(lit)
+        self.lit_value[lit] = True
+        self.lit_value[-lit] = False
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def decide(self, lit):
+        """Opens a new decision level and assigns lit on it."""
+        self.trail_lim.append(len(self.trail))
+        self.assign(lit)
+
+    def backtrack(self, level):
+        """Undoes every assignment made above the given decision level."""
+        if len(self.trail_lim) <= level:
+            return
+        stop = self.trail_lim[level]
+        for lit in self.trail[stop:]:
+            del self.lit_value[lit]
+            del self.lit_value[-lit]
+        del self.trail[stop:]
+        del self.trail_lim[level:]
+        self.qhead = min(self.qhead, stop)
+
+    def assign_units(self):
+        """
+        Assigns the input unit clauses at level 0.
+        Returns False if two of them contradict each other.
+        """
+        for u in self.units:
+            val = self.value(u)
+            if val is False:
+                return False
+            if val is None:
+                self.assign(u)
+        return True
+
+    def propagate(self):
+        """
+        Propagates every literal on the trail that has not been processed yet.
+        Returns the index of a conflicting clause, or None if no conflict was found.
+        """
+        clauses = self.clauses
+        watches = self.watches
+        lit_value = self.lit_value
+        trail = self.trail
+        while self.qhead < len(trail):
+            false_lit = -trail[self.qhead]
+            self.qhead += 1
+            watchers = watches.get(false_lit)
+            if not watchers:
+                continue
+            kept = []
+            i = 0
+            n = len(watchers)
+            while i < n:
+                ci = watchers[i]
+                i += 1
+                clause = clauses[ci]
+                # Keep the falsified watch in position 1.
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if lit_value.get(first) is True:
+                    kept.append(ci)
+                    continue
+                # Look for a replacement watch that is not false.
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if lit_value.get(lit) is not False:
+                        clause[1], clause[k] = lit, false_lit
+                        watches.setdefault(lit, []).append(ci)
+                        break
+                else:
+                    kept.append(ci)
+                    if lit_value.get(first) is False:
+                        # Conflict: keep the remaining watchers and stop.
+                        kept.extend(watchers[i:])
+                        watches[false_lit] = kept
+                        self.qhead = len(trail)
+                        return ci
+                    self.assign(first, ci)
+            watches[false_lit] = kept
+        return None
+
+    def model(self):
+        """Returns the current assignment as {variable: bool}."""
+        return {abs(l): l > 0 for l in self.trail}
+
+
+def dpll_watched(clauses, assignment={}, deadline=None):
+    """
+    DPLL with chronological backtracking driven by the two-watched-literal engine.
+    Branching variables are tried in order of decreasing occurrence count, true first.
+    The search keeps a single trail instead of copying the clause list per call.
+    Returns (True, assignment) with assignment as {variable: bool}, or (False, {}).
+    Raises TimeoutError when the deadline (timestamp) is passed.
+    """
+    engine = WatchedPropagator(clauses)
+    if engine.empty_clause or not engine.assign_units():
+        return False, {}
+    if engine.propagate() is not None:
+        return False, {}
+
+    counts = {}
+    for clause in engine.clauses:
+        for l in clause:
+            counts[abs(l)] = counts.get(abs(l), 0) + 1
+    order = sorted(engine.variables, key=lambda v: -counts.get(v, 0))
+    flipped = []  # For every decision level: was its decision already flipped?
+    pos = 0
+
+    while True:
+        if deadline is not None and time.time() > deadline:
+            raise TimeoutError("DPLL timeout reached")
+
+        while pos < len(order) and engine.value(order[pos]) is not None:
+            pos += 1
+        if pos == len(order):
+            return True, {**assignment, **engine.model()}
+
+        engine.decide(order[pos])
+        flipped.append(False)
+        while engine.propagate() is not None:
+            # Undo levels whose decision was already tried both ways.
+            while flipped and flipped[-1]:
+                flipped.pop()
+            if not flipped:
+                return False, {}
+            level = len(flipped) - 1
+            lit = engine.trail[engine.trail_lim[level]]
+            engine.backtrack(level)
+            flipped.pop()
+            engine.decide(-lit)
+            flipped.append(True)
+            # Backtracking may unassign variables before pos; rescan from the start.
+            pos = 0
+
+
+def dpll_watched_with_timeout(clauses, assignment={}, timeout=5):
+    """
+    Wrapper for dpll_watched that uses a timeout.
+    If the search does not complete within 'timeout' seconds, returns (None, {}).
+    """
+    deadline = time.time() + timeout
+    try:
+        return dpll_watched(clauses, assignment, deadline=deadline)
+    except TimeoutError:
+        return None, {}